@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+from array import array
+from collections import Counter
+from itertools import accumulate
+from typing import ClassVar
+
 from models import ZoneType
 from parser import Config
 
 
 class Vertex:
+    __slots__ = ("edges", "cap", "zone_type")
+
     def __init__(
         self,
         edges: list[Edge] | None = None,
@@ -19,6 +26,8 @@ class Vertex:
 
 
 class Edge:
+    __slots__ = ("to_hub", "cap", "weight")
+
     def __init__(self, to_hub: int, cap: int, weight: float) -> None:
         self.to_hub = to_hub
         self.cap = cap
@@ -26,10 +35,28 @@ class Edge:
 
 
 class Graph:
+    # direction-optimizing BFS thresholds from Beamer et al.
+    ALPHA: ClassVar[int] = 14
+    BETA: ClassVar[int] = 24
+    # below this many hubs a plain one-sided search is cheaper
+    SMALL: ClassVar[int] = 16
+
     def __init__(self, g: list[Vertex] | None, hub_tot: int | None) -> None:
         self.g: list[Vertex] = [] if g is None else g
         self.hub_tot: int = 0 if hub_tot is None else hub_tot
         self.inf: int = 1000000
+        # hub level adjacency in compressed sparse row (CSR) form
+        self.indptr: array[int] = array("i")
+        self.indices: array[int] = array("i")
+        # BFS scratch buffers, reused between has_solution calls
+        # one per search direction
+        self._visited: list[bytearray] = [bytearray(), bytearray()]
+        self._queue: list[array[int]] = [array("i"), array("i")]
+        # answers of earlier searches, keyed by the (low, high) hub pair
+        # since the map is undirected. only valid for the CSR arrays in
+        # _reach_src, a new indices array starts a fresh cache
+        self._reach: dict[tuple[int, int], bool] = {}
+        self._reach_src: array[int] | None = None
 
     # ===============
     # ===   IDS   ===
@@ -57,75 +84,282 @@ class Graph:
         """Return True if vertex_id points to the transit half of a layer."""
         return self.get_base_id(vertex_id) >= self.hub_tot
 
-    def has_solution(self, graph: list[Vertex]) -> bool:
-        q = []
-        visited = set()
-        q.append(0)
+    def get_csr(self, ends: list[int]) -> tuple[array[int], array[int]]:
+        """Build the hub level adjacency in CSR form from the connection
+        endpoints, connection k joins hubs ends[2k] and ends[2k + 1].
+
+        the neighbors of hub h are indices[indptr[h]:indptr[h + 1]].
+        every connection is stored in both directions. transit-partners
+        are left out, they only lead back to their restricted hub so
+        reachability between hubs is the same.
+        """
+        # each connection is one record, position p is the direction
+        # leaving ends[p] and its other end is ends[p ^ 1]. positions are
+        # grouped by source hub with a stable argsort and every loop here
+        # runs inside C builtins
+        deg = Counter(ends)
+        indptr = array("i", accumulate(
+            map(deg.__getitem__, range(self.hub_tot)), initial=0))
+        order = sorted(range(len(ends)), key=ends.__getitem__)
+        indices = array("i", map(ends.__getitem__, map((1).__xor__, order)))
+        return indptr, indices
+
+    @classmethod
+    def _expand_level(
+            cls,
+            indptr: array[int],
+            indices: array[int],
+            visited: bytearray,
+            other: bytearray,
+            q: array[int],
+            head: int,
+            tail: int,
+            bottom_up: bool
+            ) -> int:
+        """Expand the BFS level q[head:tail] and return the new tail, or
+        -1 as soon as a hub visited by the other search is reached.
+
+        the level is expanded top-down (frontier hubs push to their
+        neighbors) or bottom-up (unvisited hubs look for any visited
+        neighbor). bottom-up stops at the first visited neighbor, which
+        pays off on the big middle levels of dense maps.
+        """
+        if bottom_up:
+            for v in range(len(indptr) - 1):
+                bit = 1 << (v & 7)
+                if visited[v >> 3] & bit:
+                    continue
+                for j in range(indptr[v], indptr[v + 1]):
+                    u = indices[j]
+                    if visited[u >> 3] & (1 << (u & 7)):
+                        if other[v >> 3] & bit:
+                            return -1
+                        visited[v >> 3] |= bit
+                        q[tail] = v
+                        tail += 1
+                        break
+            return tail
+
+        for i in range(head, tail):
+            curr = q[i]
+            for j in range(indptr[curr], indptr[curr + 1]):
+                nxt = indices[j]
+                bit = 1 << (nxt & 7)
+                if other[nxt >> 3] & bit:
+                    return -1
+                if not visited[nxt >> 3] & bit:
+                    visited[nxt >> 3] |= bit
+                    q[tail] = nxt
+                    tail += 1
+        return tail
+
+    @classmethod
+    def _bfs(
+            cls,
+            indptr: array[int],
+            indices: array[int],
+            start_id: int,
+            end_id: int,
+            visited: list[bytearray],
+            queues: list[array[int]]
+            ) -> bool:
+        """Bidirectional, direction-optimizing breadth first search over
+        CSR arrays. side 0 searches from start_id and side 1 from end_id,
+        there is a path as soon as one side reaches a hub of the other.
+
+        each round expands the side with fewer frontier edges by a level,
+        so on long chain-like maps both searches meet in the middle.
+        every level picks top-down or bottom-up with Beamer's heuristic.
+
+        every hub is enqueued at most once per side so the queues are
+        preallocated int arrays from the caller (one slot per hub) used
+        with head/tail indices. visited holds one bitset per side, hub h
+        is bit (h & 7) of byte (h >> 3). they are cleared
+        here so the caller can hand in the same buffers each time.
+        """
+        n = len(indptr) - 1
+        heads = [0, 0]
+        tails = [1, 1]
+        # edges out of the frontier and out of the unvisited hubs
+        m_f = [0, 0]
+        m_u = [0, 0]
+        bottom_up = [False, False]
+        for k, root in enumerate((start_id, end_id)):
+            visited[k][:] = bytes(len(visited[k]))
+            visited[k][root >> 3] |= 1 << (root & 7)
+            queues[k][0] = root
+            m_f[k] = indptr[root + 1] - indptr[root]
+            m_u[k] = indptr[n] - m_f[k]
+
+        while heads[0] < tails[0] and heads[1] < tails[1]:
+            k = 0 if m_f[0] <= m_f[1] else 1
+            if bottom_up[k]:
+                bottom_up[k] = (tails[k] - heads[k]) * cls.BETA >= n
+            else:
+                bottom_up[k] = m_f[k] * cls.ALPHA > m_u[k]
+
+            level_end = tails[k]
+            tail = cls._expand_level(
+                    indptr,
+                    indices,
+                    visited[k],
+                    visited[1 - k],
+                    queues[k],
+                    heads[k],
+                    level_end,
+                    bottom_up[k])
+            if tail < 0:
+                return True
+            heads[k] = level_end
+            tails[k] = tail
+
+            m_f[k] = sum(indptr[u + 1] - indptr[u]
+                         for u in queues[k][level_end:tail])
+            m_u[k] -= m_f[k]
+        return False
 
-        while len(q) > 0:
-            curr = q.pop()
-            for e in graph[curr].edges:
-                # end index
-                if e.to_hub == (len(graph) / 2) - 1:
+    @staticmethod
+    def _bfs_small(
+            indptr: array[int],
+            indices: array[int],
+            start_id: int,
+            end_id: int
+            ) -> bool:
+        """One-sided top-down search for tiny maps, where the two
+        frontiers and the direction heuristic cost more than they save."""
+        seen = [False] * (len(indptr) - 1)
+        seen[start_id] = True
+        queue = [start_id]
+        for u in queue:
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                if v == end_id:
                     return True
-                if e.to_hub not in visited:
-                    q.append(e.to_hub)
-                    visited.add(e.to_hub)
+                if not seen[v]:
+                    seen[v] = True
+                    queue.append(v)
         return False
 
-    # I did this in O(H * C) time but if I instantiated all the vertices
-    # in line 14-23 and added the connections as I went it would be
-    # O(H + 2C + restricted hubs) but I tested and don't want to rewrite.
-    # all the example maps run in milliseconds
+    def has_solution(self, start_id: int, end_id: int) -> bool:
+        """Return True if end_id can be reached from start_id.
+
+        walks the CSR arrays built by get_csr
+        """
+        if start_id == end_id:
+            return True
+        # neighbors need no search and no scratch buffers
+        first = self.indptr[start_id]
+        last = self.indptr[start_id + 1]
+        if end_id in self.indices[first:last]:
+            return True
+        if self._reach_src is not self.indices:
+            self._reach = {}
+            self._reach_src = self.indices
+        key = ((start_id, end_id) if start_id < end_id
+               else (end_id, start_id))
+        found = self._reach.get(key)
+        if found is not None:
+            return found
+
+        n = len(self.indptr) - 1
+        if n < self.SMALL:
+            found = self._bfs_small(self.indptr, self.indices,
+                                    start_id, end_id)
+        else:
+            if len(self._queue[0]) != n:
+                self._visited = [bytearray((n + 7) >> 3) for _ in range(2)]
+                self._queue = [array("i", [0]) * n for _ in range(2)]
+            found = self._bfs(
+                    self.indptr,
+                    self.indices,
+                    start_id,
+                    end_id,
+                    self._visited,
+                    self._queue)
+        self._reach[key] = found
+        return found
+
+    @staticmethod
+    def get_hub_dict(cfg: Config) -> dict[str, int]:
+        """Return the name -> id map of a Config, checking that the ids
+        match the hub positions, that the names are unique and that every
+        connection endpoint is a known hub, so the build loop can index
+        the map directly. rebuilt on every graph build since the Config
+        may have been edited after parsing."""
+        hub_dict: dict[str, int] = {}
+        for i, hub in enumerate(cfg.hubs):
+            if hub.id != i:
+                raise ValueError("Parsing error")
+            if hub.name in hub_dict:
+                raise ValueError("Duplicate name found for hub")
+            hub_dict[hub.name] = i
+        for c in cfg.connections:
+            if c.hub1 not in hub_dict or c.hub2 not in hub_dict:
+                raise ValueError("Unknown name found in connection")
+        return hub_dict
+
+    def _add_edge(
+            self,
+            base_graph: list[Vertex],
+            from_id: int,
+            to_id: int,
+            cap: int
+            ) -> None:
+        """Add the directed edge from_id -> to_id to the base graph.
+
+        restricted destinations are entered through their transit-partner
+        and priority destinations are made slightly cheaper.
+        """
+        dest_zone = base_graph[to_id].zone_type
+        if dest_zone == ZoneType.RESTRICTED:
+            # set transit to restricted
+            base_graph[self.get_r_id(to_id)].edges.append(
+                    Edge(to_id, cap, 1))
+            # add edge to edges to transit
+            base_graph[from_id].edges.append(
+                    Edge(self.get_r_id(to_id), cap, 1))
+        elif dest_zone == ZoneType.PRIORITY:
+            base_graph[from_id].edges.append(Edge(to_id, cap, 0.99))
+        # if zone_type is NORMAL, START, or END
+        else:
+            base_graph[from_id].edges.append(Edge(to_id, cap, 1))
+
     def get_base_graph(self, cfg: Config) -> list[Vertex]:
         """ Build adjacency list from the Config.
 
         Creates transit-partners for hubs with ZoneType.RESTRICTED
         all the unused hubs are set to the default empty node Vertex()
+        connections to blocked hubs are pruned while the edges are added,
+        so the whole build is O(H + C)
         """
         self.hub_tot = len(cfg.hubs)
-        base_graph: list[Vertex] = [Vertex()
-                                    for _ in range(0, 2 * self.hub_tot)]
-        hub_dict = {hub.name: hub.id for hub in cfg.hubs}
+        hub_dict = self.get_hub_dict(cfg)
 
-        for i, hub in enumerate(cfg.hubs):
-            if hub.id != i:
-                raise ValueError("Parsing error")
-            if hub.zone_type == ZoneType.RESTRICTED:
-                base_graph[self.get_r_id(i)] = Vertex(
-                        None,
-                        hub.max_drones,
-                        ZoneType.RESTRICTED)
-            else:
-                base_graph[self.get_r_id(i)] = Vertex(cap=0)
+        # hub i sits at i and its transit-partner at get_r_id(i), so the
+        # whole list is built in order without placeholder vertices
+        base_graph: list[Vertex] = [
+            Vertex(None, hub.max_drones, hub.zone_type) for hub in cfg.hubs
+        ]
+        base_graph += [
+            Vertex(None, hub.max_drones, ZoneType.RESTRICTED)
+            if hub.zone_type == ZoneType.RESTRICTED
+            else Vertex(cap=0)
+            for hub in cfg.hubs
+        ]
 
-        for i, hub in enumerate(cfg.hubs):
-            edges: list[Edge] = []
-            cap = hub.max_drones
-            for c in cfg.connections:
-
-                if hub.name == c.hub1:
-                    h_id = hub_dict[c.hub2]
-                elif hub.name == c.hub2:
-                    h_id = hub_dict[c.hub1]
-                else:
-                    continue
+        # endpoints of the unpruned connections for the CSR
+        ends: list[int] = []
+        for c in cfg.connections:
+            h1 = hub_dict[c.hub1]
+            h2 = hub_dict[c.hub2]
+            if (base_graph[h1].zone_type == ZoneType.BLOCKED
+                    or base_graph[h2].zone_type == ZoneType.BLOCKED):
+                continue
+            self._add_edge(base_graph, h1, h2, c.max_link_capacity)
+            self._add_edge(base_graph, h2, h1, c.max_link_capacity)
+            ends += (h1, h2)
 
-                curr_dest = cfg.hubs[h_id].zone_type
-                if curr_dest == ZoneType.RESTRICTED:
-                    # set transit to restricted
-                    transit_edges = base_graph[self.get_r_id(h_id)].edges
-                    transit_edges.append(Edge(h_id, c.max_link_capacity, 1))
-                    # add edge to edges to transit
-                    edges.append(Edge(
-                        self.get_r_id(h_id), c.max_link_capacity, 1))
-                elif curr_dest == ZoneType.PRIORITY:
-                    edges.append(Edge(h_id, c.max_link_capacity, 0.99))
-                # if zone_type is NORMAL, START, or END
-                else:
-                    edges.append(Edge(h_id, c.max_link_capacity, 1))
-            base_graph[i] = Vertex(edges, cap, hub.zone_type)
-        if self.has_solution(base_graph) is False:
+        self.indptr, self.indices = self.get_csr(ends)
+        if self.has_solution(cfg.start_hub.id, cfg.end_hub.id) is False:
             raise ValueError("the start and end are not connected brother")
 
         return base_graph
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import ClassVar
 
 
 class Metadata(str, Enum):
@@ -63,7 +62,9 @@ class Color(str, Enum):
 
 
 class Hub:
-    _next_id: ClassVar[int] = 0
+    __slots__ = (
+        "id", "name", "x", "y", "zone_type", "color", "max_drones"
+    )
 
     def __init__(
         self,
@@ -72,10 +73,11 @@ class Hub:
         y: int,
         zone_type: ZoneType = ZoneType.NORMAL,
         color: str | None = None,
-        max_drones: int = 1
+        max_drones: int = 1,
+        id: int = -1
     ) -> None:
-        self.id = Hub._next_id
-        Hub._next_id += 1
+        # position in Config.hubs, assigned by the parser
+        self.id = id
         self.name = name
         self.x = x
         self.y = y
@@ -83,27 +85,30 @@ class Hub:
         self.color = color
         self.max_drones = max_drones
 
-    @classmethod
-    def reset_next_id(cls) -> None:
-        cls._next_id = 0
-
     # ai generated
-    def print(self) -> None:
-        print(f"id: {self.id}")
-        print(f"name: {self.name}")
-        print(f"x: {self.x}")
-        print(f"y: {self.y}")
-        print(f"zone: {self.zone_type.value}")
+    def to_str(self) -> str:
+        """ the lines print() shows, without the trailing newline """
         color_name: str = self.color if self.color is not None else "none"
         color_lookup: str = self.color if self.color is not None else "default"
         color_code: str = Color.code_for_name(color_lookup)
         color_swatch: str = f"{color_code}##{Color.RESET.value}"
-        print(f"color: {color_name} ({color_swatch})")
         if (self.zone_type == ZoneType.START
                 or self.zone_type == ZoneType.END):
-            print("max_drones: \u221e")
+            max_drones = "\u221e"
         else:
-            print(f"max_drones: {self.max_drones}")
+            max_drones = str(self.max_drones)
+        return (
+            f"id: {self.id}\n"
+            f"name: {self.name}\n"
+            f"x: {self.x}\n"
+            f"y: {self.y}\n"
+            f"zone: {self.zone_type.value}\n"
+            f"color: {color_name} ({color_swatch})\n"
+            f"max_drones: {max_drones}"
+        )
+
+    def print(self) -> None:
+        print(self.to_str())
 
     # ai generated
     def short_print(self) -> None:
@@ -122,6 +127,8 @@ class Hub:
 
 
 class Connection:
+    __slots__ = ("hub1", "hub2", "max_link_capacity")
+
     def __init__(
         self,
         hub1: str,
@@ -133,7 +140,13 @@ class Connection:
         self.max_link_capacity = max_link_capacity
 
     # ai generated
+    def to_str(self) -> str:
+        """ the lines print() shows, without the trailing newline """
+        return (
+            f"hub1: {self.hub1}\n"
+            f"hub2: {self.hub2}\n"
+            f"max_link_capacity: {self.max_link_capacity}"
+        )
+
     def print(self) -> None:
-        print(f"hub1: {self.hub1}")
-        print(f"hub2: {self.hub2}")
-        print(f"max_link_capacity: {self.max_link_capacity}")
+        print(self.to_str())
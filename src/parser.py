@@ -11,9 +11,48 @@
 
 from __future__ import annotations
 
-from typing import Any
+import io
+import re
+import sys
+from typing import Any, Iterable
 from models import Connection, Hub, Metadata, ZoneType
 
+# "<key>: <value>" for every known directive key, compiled once so a
+# line is checked, trimmed and split by a single match. blank and
+# comment lines match too, with no key group, so they cost one call.
+# the payload is greedy up to its last non-space byte (a lazy group
+# would retry the tail after every byte), and None when it is empty
+_LINE_RE = re.compile(
+    r"\s*(?:#|$|(nb_drones|start_hub|end_hub|hub|connection)"
+    r"\s*:\s*(.*\S)?\s*$)")
+# well formed hub and connection payloads, matched on the stripped
+# value. anything else goes through the split based path, which knows
+# which error to raise
+_HUB_RE = re.compile(r"([^\s\-]+) ([-+]?[0-9]+) ([-+]?[0-9]+)(?: (.*))?")
+_CONN_RE = re.compile(r"([^\s\-]+)-([^\s\-]+)(?: (.*))?")
+# one metadata item: key=value, or a lone word that is missing its '='
+_META_RE = re.compile(r"([^\s=]*)=(\S*)|(\S+)")
+
+# plain dict lookups instead of going through the enum constructors
+_METADATA_BY_VALUE = {m.value: m for m in Metadata}
+_ZONE_BY_VALUE = {z.value: z for z in ZoneType}
+# base zone of a hub by the directive that declared it
+_S_OR_E_TABLE: dict[str | None, ZoneType] = {
+    None: ZoneType.NORMAL,
+    "start_hub": ZoneType.START,
+    "end_hub": ZoneType.END,
+}
+_VALID_METADATA = {
+    "hub": frozenset({
+        Metadata.ZONE,
+        Metadata.COLOR,
+        Metadata.MAX_DRONES,
+    }),
+    "connection": frozenset({
+        Metadata.MAX_LINK_CAPACITY,
+    }),
+}
+
 
 class Config:
     def __init__(
@@ -31,39 +70,35 @@ class Config:
         self.connections = connections
 
     @staticmethod
-    def _validate_names(cfg: Config) -> Config:
-        """ checks that all hubs have unique names and that
-        all connections have valid names """
-        names_set = set()
-
-        names_list = [
-                hub.name
-                for hub in cfg.hubs
-                ]
-
-        for name in names_list:
-            if name in names_set:
-                raise ValueError("Duplicate name found for hub")
-            names_set.add(name)
-
-        connection_names = [
-                connection.hub1
-                for connection in cfg.connections
-                ]
-        connection_names += [
-                connection.hub2
-                for connection in cfg.connections
-                ]
-
-        for name in connection_names:
-            if name not in names_set:
+    def _validate_names(cfg: Config, hub_ids: dict[str, int]) -> Config:
+        """ checks that all connections have valid names against the
+        name -> id map built (and checked for duplicates) while parsing """
+        for connection in cfg.connections:
+            if (connection.hub1 not in hub_ids
+                    or connection.hub2 not in hub_ids):
                 raise ValueError("Invalid name found in connections")
-
         return cfg
 
     @classmethod
     def from_file(cls, filename: str) -> Config:
         """Parse a config map file and return a populated ``Config``.
+        see ``_from_lines`` for the format and the checks.
+        the file is streamed line by line, so only the current line and
+        the read buffer are held at a time. universal newlines turn CR
+        and CRLF line ends into LF"""
+        with open(filename, 'r', encoding="utf-8") as f:
+            return cls._from_lines(f)
+
+    @classmethod
+    def from_string(cls, text: str) -> Config:
+        """Parse a config map held in memory, same rules as ``from_file``
+        without touching the filesystem. the StringIO splits lines with
+        the same universal newlines as a file opened in text mode"""
+        return cls._from_lines(io.StringIO(text, newline=None))
+
+    @classmethod
+    def _from_lines(cls, lines: Iterable[str]) -> Config:
+        """Parse the lines of a config map into a ``Config``.
 
         Expected directives:
         - ``nb_drones: <positive_integer>`` (single occurrence)
@@ -82,90 +117,78 @@ class Config:
         Per-directive semantic validation is delegated to:
         ``_parse_nb_drones``, ``_parse_hub``, and ``_parse_connection``.
         """
-        Hub.reset_next_id()
-        try:
-            all_keys: dict[str, dict[str, Any]] = {
-                "nb_drones": {
-                    "func": cls._parse_nb_drones,
-                    "no_dup": True,
-                    "required": True,
-                    "val": None,
-                },
-                "start_hub": {
-                    "func": cls._parse_hub,
-                    "no_dup": True,
-                    "required": True,
-                    "val": None,
-                },
-                "end_hub": {
-                    "func": cls._parse_hub,
-                    "no_dup": True,
-                    "required": True,
-                    "val": None,
-                },
-                "hub": {
-                    "func": cls._parse_hub,
-                    "no_dup": False,
-                    "required": False,
-                    "val": [],
-                },
-                "connection": {
-                    "func": cls._parse_connection,
-                    "no_dup": False,
-                    "required": False,
-                    "val": [],
-                },
-            }
-
-            no_dup: set[str] = set()
-            with open(filename, 'r', encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line == "":
-                        continue
-                    elif line[0] == '#':
-                        continue
-                    if ":" not in line:
-                        raise ValueError("No ':' character in line")
-                    key, value_str = line.split(":", 1)
-                    key = key.strip()
-                    if key not in all_keys:
-                        err_str = "Key must be 'nb_drones', "
-                        err_str += "'start_hub', 'end_hub', 'hub', "
-                        err_str += "or 'connection'"
-                        raise ValueError(err_str)
-                    if key in no_dup:
-                        raise ValueError(f"{key}: No have duplicate configs")
-                    if all_keys[key]["no_dup"]:
-                        no_dup.add(key)
-                    if key in {"start_hub", "end_hub"}:
-                        hub = all_keys[key]["func"](value_str, key)
-                        all_keys["hub"]["val"].append(hub)
-                        all_keys[key]["val"] = hub
-                    elif key in {"hub", "connection"}:
-                        parser_func = all_keys[key]["func"]
-                        all_keys[key]["val"].append(parser_func(value_str))
-                    else:
-                        all_keys[key]["val"] = all_keys[key]["func"](value_str)
+        nb_drones: int | None = None
+        start_hub: Hub | None = None
+        end_hub: Hub | None = None
+        hubs: list[Hub] = []
+        connections: list[Connection] = []
+        # bound once, the loop below appends on every hub/connection line
+        add_hub = hubs.append
+        add_connection = connections.append
+        hub_ids: dict[str, int] = {}
+
+        for line in lines:
+            match = _LINE_RE.match(line)
+            if match is None:
+                if ":" not in line:
+                    raise ValueError("No ':' character in line")
+                err_str = "Key must be 'nb_drones', "
+                err_str += "'start_hub', 'end_hub', 'hub', "
+                err_str += "or 'connection'"
+                raise ValueError(err_str)
+            key, value_str = match.groups()
+            if key is None:
+                continue
+            if value_str is None:
+                value_str = ""
 
+            if key == "connection":
+                add_connection(cls._parse_connection(value_str))
+                continue
+            if key == "nb_drones":
+                if nb_drones is not None:
+                    raise ValueError("nb_drones: No have duplicate configs")
+                nb_drones = cls._parse_nb_drones(value_str)
+                continue
+
+            # a hub id is its position in the hub list
+            if key == "hub":
+                hub = cls._parse_hub(value_str, None, len(hubs))
+            elif key == "start_hub":
+                if start_hub is not None:
+                    raise ValueError("start_hub: No have duplicate configs")
+                hub = start_hub = cls._parse_hub(
+                    value_str, "start_hub", len(hubs))
+            else:
+                if end_hub is not None:
+                    raise ValueError("end_hub: No have duplicate configs")
+                hub = end_hub = cls._parse_hub(
+                    value_str, "end_hub", len(hubs))
+            if hub.name in hub_ids:
+                raise ValueError("Duplicate name found for hub")
+            hub_ids[hub.name] = hub.id
+            add_hub(hub)
+
+        if nb_drones is None or start_hub is None or end_hub is None:
             missing: list[str] = [
                 req_key
-                for req_key, req_config in all_keys.items()
-                if req_config["required"] and req_config["val"] is None
+                for req_key, req_val in (
+                    ("nb_drones", nb_drones),
+                    ("start_hub", start_hub),
+                    ("end_hub", end_hub),
+                )
+                if req_val is None
             ]
-            if missing:
-                missing_str = ", ".join(missing)
-                raise ValueError(f"missing required config(s): {missing_str}")
-
-            return Config._validate_names(cls(
-                all_keys['nb_drones']['val'],
-                all_keys['start_hub']['val'],
-                all_keys['end_hub']['val'],
-                all_keys['hub']['val'],
-                all_keys['connection']['val'],
-            ))
-        finally:
-            Hub.reset_next_id()
+            missing_str = ", ".join(missing)
+            raise ValueError(f"missing required config(s): {missing_str}")
+
+        return Config._validate_names(cls(
+            nb_drones,
+            start_hub,
+            end_hub,
+            hubs,
+            connections,
+        ), hub_ids)
 
     @staticmethod
     def _parse_metadata(
@@ -179,22 +202,10 @@ class Config:
         token: str = metadata_token.strip()
         parsed: dict[Metadata, Any] = {}
 
-        if not (obj == "hub"
-                or obj == "connection"):
+        valid_metadata = _VALID_METADATA.get(obj)
+        if valid_metadata is None:
             raise ValueError("Object must be 'hub' or 'connection'")
 
-        valid_metadata: set[Metadata] = set()
-        if obj == "hub":
-            valid_metadata = {
-                Metadata.ZONE,
-                Metadata.COLOR,
-                Metadata.MAX_DRONES,
-            }
-        else:
-            valid_metadata = {
-                Metadata.MAX_LINK_CAPACITY,
-            }
-
         if token == "":
             return parsed
 
@@ -205,23 +216,14 @@ class Config:
         if raw_items == "":
             return parsed
 
-        for item in raw_items.split():
-            key_str: str
-            value_str: str
-
-            if "=" not in item:
+        for key_str, value_str, bad_item in _META_RE.findall(raw_items):
+            if bad_item:
                 raise ValueError("metadata item must be in key=value format")
-
-            key_str, value_str = item.split("=", 1)
-            key_str = key_str.strip()
-            value_str = value_str.strip()
-
             if key_str == "" or value_str == "":
                 raise ValueError("metadata key and value must be non-empty")
-            try:
-                key = Metadata(key_str)
-            except ValueError as e:
-                raise ValueError(f"unsupported metadata key: {key_str}") from e
+            key = _METADATA_BY_VALUE.get(key_str)
+            if key is None:
+                raise ValueError(f"unsupported metadata key: {key_str}")
             if key not in valid_metadata:
                 raise ValueError(
                     f"metadata not allowed for {obj}: {key.value}"
@@ -230,25 +232,17 @@ class Config:
                 raise ValueError(f"duplicate metadata key: {key.value}")
 
             if key == Metadata.ZONE:
-                try:
-                    parsed[key] = ZoneType(value_str)
-                except ValueError as e:
-                    raise ValueError(
-                        f"invalid zone type: {value_str}"
-                    ) from e
+                zone = _ZONE_BY_VALUE.get(value_str)
+                if zone is None:
+                    raise ValueError(f"invalid zone type: {value_str}")
+                parsed[key] = zone
                 continue
             elif key == Metadata.COLOR:
                 parsed[key] = value_str
                 continue
             elif (key == Metadata.MAX_DRONES
                     or key == Metadata.MAX_LINK_CAPACITY):
-                try:
-                    value = int(value_str)
-                except ValueError as e:
-                    raise ValueError(
-                        f"metadata {key.value} must be an integer"
-                    ) from e
-
+                value = Config._safe_int(value_str, key)
                 if value < 1:
                     raise ValueError(
                         f"metadata {key.value} must be a positive integer"
@@ -258,12 +252,22 @@ class Config:
         return parsed
 
     @staticmethod
-    def _parse_int(int_str: str) -> int:
-        try:
-            num = int(int_str)
-        except ValueError as e:
-            raise ValueError("value_str is an invalid integer") from e
-        return num
+    def _safe_int(token: str, label: Metadata | None = None) -> int:
+        """ checks the digits up front instead of catching int()'s
+        exception. without a label (coordinates, nb_drones) an optional
+        sign is allowed, metadata values pass their key as label and
+        must be plain ascii digits. the label is only formatted into the
+        message when the token is rejected """
+        s = token.strip()
+        if label is None and s[:1] in ("-", "+"):
+            digits = s[1:]
+        else:
+            digits = s
+        if not (digits.isascii() and digits.isdigit()):
+            if label is None:
+                raise ValueError("value_str is an invalid integer")
+            raise ValueError(f"metadata {label.value} must be an integer")
+        return int(s)
 
     @staticmethod
     def _parse_name(name: str) -> str:
@@ -272,7 +276,8 @@ class Config:
         name = name.strip()
         if name == "":
             raise ValueError("Name must not be an empty string")
-        return name
+        # interned so the name -> id lookups compare by identity
+        return sys.intern(name)
 
     @staticmethod
     def _parse_nb_drones(value_str: str) -> int:
@@ -284,15 +289,20 @@ class Config:
         - Ensure value is strictly positive (>= 1).
         - Raise ``ValueError`` on malformed or invalid value.
         """
-        nb_drones = Config._parse_int(value_str.strip())
+        nb_drones = Config._safe_int(value_str)
         if nb_drones < 1:
             raise ValueError("No drones given in map")
         return nb_drones
 
     @staticmethod
-    def _parse_hub(value_str: str, s_or_e: str | None = None) -> Hub:
+    def _parse_hub(
+        value_str: str,
+        s_or_e: str | None = None,
+        hub_id: int = -1
+    ) -> Hub:
         """Parse and validate a ``start_hub``, ``end_hub``, or ``hub`` payload.
         s_or_e is short for start or end to fit the flake8 standard
+        hub_id is the position the hub will have in ``Config.hubs``
         Validation outline:
         - Expect ``<name> <x> <y> [metadata]`` format.
         - Ensure name is non-empty and does not contain ``-``.
@@ -301,35 +311,39 @@ class Config:
         - Validate metadata keys and value types (zone/color/max_drones).
         - Raise ``ValueError`` on malformed payload or invalid values.
         """
-        params = value_str.strip().split(" ", 3)
-        if len(params) < 3:
-            err_str = "Invalid number of params. "
-            err_str += "usage: hub: <name> <x> <y> [metadata]"
-            raise ValueError(err_str)
-        if len(params) == 3:
-            return Hub(
-                Config._parse_name(params[0]),
-                Config._parse_int(params[1]),
-                Config._parse_int(params[2]),
-                ZoneType.NORMAL if s_or_e is None else ZoneType(s_or_e)
-                )
-
-        metadata = Config._parse_metadata(params[3], 'hub')
-        zone = ZoneType.NORMAL if s_or_e is None else ZoneType(s_or_e)
-        if s_or_e and Metadata.ZONE in metadata:
-            raise ValueError("Duplicate zones inputted")
-        zone = metadata.get(Metadata.ZONE, zone)
-        color = metadata.get(Metadata.COLOR)
-        max_drones = metadata.get(Metadata.MAX_DRONES, 1)
-
-        return Hub(
-            Config._parse_name(params[0]),
-            Config._parse_int(params[1]),
-            Config._parse_int(params[2]),
-            zone,
-            color,
-            max_drones
-            )
+        zone = _S_OR_E_TABLE.get(s_or_e)
+        if zone is None:
+            raise ValueError("s_or_e must be 'start_hub', 'end_hub' or None")
+        value_str = value_str.strip()
+        match = _HUB_RE.fullmatch(value_str)
+        meta: str | None
+        if match is not None:
+            name, x_str, y_str, meta = match.groups()
+            name = sys.intern(name)
+            x = int(x_str)
+            y = int(y_str)
+        else:
+            params = value_str.split(" ", 3)
+            if len(params) < 3:
+                err_str = "Invalid number of params. "
+                err_str += "usage: hub: <name> <x> <y> [metadata]"
+                raise ValueError(err_str)
+            name = Config._parse_name(params[0])
+            x = Config._safe_int(params[1])
+            y = Config._safe_int(params[2])
+            meta = params[3] if len(params) == 4 else None
+        color = None
+        max_drones = 1
+
+        if meta is not None:
+            metadata = Config._parse_metadata(meta, 'hub')
+            if s_or_e and Metadata.ZONE in metadata:
+                raise ValueError("Duplicate zones inputted")
+            zone = metadata.get(Metadata.ZONE, zone)
+            color = metadata.get(Metadata.COLOR)
+            max_drones = metadata.get(Metadata.MAX_DRONES, 1)
+
+        return Hub(name, x, y, zone, color, max_drones, hub_id)
 
     @staticmethod
     def _parse_connection(value_str: str) -> Connection:
@@ -344,21 +358,31 @@ class Config:
         - Raise ``ValueError`` on malformed payload or invalid values.
         """
         value_str = value_str.strip()
-        if value_str == "":
-            raise ValueError("Value string is an empty string")
-        params = value_str.split(" ", 1)
-        endpoints = params[0].split("-", 1)
-        if len(endpoints) != 2:
-            raise ValueError("No dash (-) present in connection endpoints")
-        if len(params) == 2:
-            metadata = Config._parse_metadata(params[1], "connection")
+        match = _CONN_RE.fullmatch(value_str)
+        meta: str | None
+        if match is not None:
+            name1, name2, meta = match.groups()
+            name1 = sys.intern(name1)
+            name2 = sys.intern(name2)
+        else:
+            if value_str == "":
+                raise ValueError("Value string is an empty string")
+            params = value_str.split(" ", 1)
+            endpoints = params[0].split("-", 1)
+            if len(endpoints) != 2:
+                raise ValueError(
+                    "No dash (-) present in connection endpoints")
+            meta = params[1] if len(params) == 2 else None
+        if meta is not None:
+            metadata = Config._parse_metadata(meta, "connection")
             if not metadata:
                 raise ValueError("Empty Metadata")
             max_lc = metadata[Metadata.MAX_LINK_CAPACITY]
         else:
             max_lc = 1
-        name1 = Config._parse_name(endpoints[0])
-        name2 = Config._parse_name(endpoints[1])
+        if match is None:
+            name1 = Config._parse_name(endpoints[0])
+            name2 = Config._parse_name(endpoints[1])
         if name1 == name2:
             err_str = "Connection cannot have same source and destination"
             raise ValueError(err_str)
@@ -372,19 +396,19 @@ class Config:
     def print_hubs(self) -> None:
         """Print all hubs line-by-line with a colored status message."""
         Config.print_in_box("Printing hubs")
-        for idx, hub in enumerate(self.hubs):
-            hub.print()
-            if idx < len(self.hubs) - 1:
-                print()
+        # one write for the whole list, blank line between hubs
+        if self.hubs:
+            sys.stdout.write(
+                "\n\n".join([hub.to_str() for hub in self.hubs]) + "\n")
 
     # ai generated
     def print_connections(self) -> None:
         """Print all connections line-by-line with a colored status message."""
         Config.print_in_box("Printing connections")
-        for idx, connection in enumerate(self.connections):
-            connection.print()
-            if idx < len(self.connections) - 1:
-                print()
+        if self.connections:
+            sys.stdout.write("\n\n".join(
+                [connection.to_str() for connection in self.connections]
+            ) + "\n")
 
     # ai generated
     def print(self) -> None:
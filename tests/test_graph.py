@@ -15,20 +15,10 @@ from models import Connection, Hub, ZoneType
 from parser import Config
 
 
-@pytest.fixture(autouse=True)
-def _reset_hub_ids() -> None:
-    Hub.reset_next_id()
-    yield
-    Hub.reset_next_id()
-
-
 def _cfg_with_zone_type_attr(
     hubs: list[Hub],
     connections: list[Connection],
 ) -> Config:
-    for hub in hubs:
-        # graph.py currently reads `hub.zone_type`; mirror parsed-zone value here.
-        hub.zone_type = hub.zone
     return Config(
         nb_drones=1,
         start_hub=hubs[0],
@@ -52,9 +42,9 @@ def test_id_helpers_map_indices_across_layers() -> None:
 
 
 def test_get_base_graph_builds_base_and_transit_vertices() -> None:
-    hub_s = Hub("s", 0, 0, zone=ZoneType.NORMAL, max_drones=3)
-    hub_r = Hub("r", 1, 1, zone=ZoneType.RESTRICTED, max_drones=2)
-    hub_p = Hub("p", 2, 2, zone=ZoneType.PRIORITY, max_drones=5)
+    hub_s = Hub("s", 0, 0, zone_type=ZoneType.NORMAL, max_drones=3, id=0)
+    hub_r = Hub("r", 1, 1, zone_type=ZoneType.RESTRICTED, max_drones=2, id=1)
+    hub_p = Hub("p", 2, 2, zone_type=ZoneType.PRIORITY, max_drones=5, id=2)
     cfg = _cfg_with_zone_type_attr(
         [hub_s, hub_r, hub_p],
         [
@@ -81,9 +71,9 @@ def test_get_base_graph_builds_base_and_transit_vertices() -> None:
 
 
 def test_get_base_graph_routes_restricted_destinations_via_transit() -> None:
-    hub_a = Hub("a", 0, 0, zone=ZoneType.NORMAL)
-    hub_r = Hub("r", 1, 1, zone=ZoneType.RESTRICTED)
-    hub_b = Hub("b", 2, 2, zone=ZoneType.NORMAL)
+    hub_a = Hub("a", 0, 0, zone_type=ZoneType.NORMAL, id=0)
+    hub_r = Hub("r", 1, 1, zone_type=ZoneType.RESTRICTED, id=1)
+    hub_b = Hub("b", 2, 2, zone_type=ZoneType.NORMAL, id=2)
     cfg = _cfg_with_zone_type_attr(
         [hub_a, hub_r, hub_b],
         [
@@ -112,9 +102,8 @@ def test_get_base_graph_routes_restricted_destinations_via_transit() -> None:
 
 
 def test_get_base_graph_raises_on_non_contiguous_hub_ids() -> None:
-    hub_a = Hub("a", 0, 0)
-    _hub_b = Hub("b", 1, 1)
-    hub_c = Hub("c", 2, 2)
+    hub_a = Hub("a", 0, 0, id=0)
+    hub_c = Hub("c", 2, 2, id=2)
     cfg = _cfg_with_zone_type_attr([hub_a, hub_c], [])
 
     graph = Graph(None, None)
@@ -123,9 +112,25 @@ def test_get_base_graph_raises_on_non_contiguous_hub_ids() -> None:
         graph.get_base_graph(cfg)
 
 
+def test_get_base_graph_rejects_duplicate_hub_names() -> None:
+    hubs = [Hub("a", 0, 0, id=0), Hub("a", 1, 1, id=1)]
+    cfg = _cfg_with_zone_type_attr(hubs, [])
+
+    with pytest.raises(ValueError, match="Duplicate name"):
+        Graph(None, None).get_base_graph(cfg)
+
+
+def test_get_base_graph_rejects_unknown_hub_name_in_connections() -> None:
+    hubs = [Hub("a", 0, 0, id=0), Hub("b", 1, 1, id=1)]
+    cfg = _cfg_with_zone_type_attr(hubs, [Connection("a", "ghost", 1)])
+
+    with pytest.raises(ValueError, match="Unknown name found in connection"):
+        Graph(None, None).get_base_graph(cfg)
+
+
 def test_get_r_expanded_list_adds_reverse_wait_for_base_nodes_only() -> None:
-    hub_a = Hub("a", 0, 0, zone=ZoneType.NORMAL)
-    hub_r = Hub("r", 1, 1, zone=ZoneType.RESTRICTED)
+    hub_a = Hub("a", 0, 0, zone_type=ZoneType.NORMAL, id=0)
+    hub_r = Hub("r", 1, 1, zone_type=ZoneType.RESTRICTED, id=1)
     cfg = _cfg_with_zone_type_attr([hub_a, hub_r], [Connection("a", "r", 5)])
 
     graph = Graph(None, None)
@@ -147,8 +152,8 @@ def test_get_r_expanded_list_adds_reverse_wait_for_base_nodes_only() -> None:
 
 
 def test_get_r_expanded_list_adds_reverse_movement_edges() -> None:
-    hub_a = Hub("a", 0, 0, zone=ZoneType.NORMAL)
-    hub_b = Hub("b", 1, 1, zone=ZoneType.NORMAL)
+    hub_a = Hub("a", 0, 0, zone_type=ZoneType.NORMAL, id=0)
+    hub_b = Hub("b", 1, 1, zone_type=ZoneType.NORMAL, id=1)
     cfg = _cfg_with_zone_type_attr([hub_a, hub_b], [Connection("a", "b", 3)])
 
     graph = Graph(None, None)
@@ -163,8 +168,8 @@ def test_get_r_expanded_list_adds_reverse_movement_edges() -> None:
 
 
 def test_get_r_expanded_list_preserves_vertex_count_and_caps() -> None:
-    hub_a = Hub("a", 0, 0, zone=ZoneType.START, max_drones=4)
-    hub_b = Hub("b", 1, 1, zone=ZoneType.END, max_drones=2)
+    hub_a = Hub("a", 0, 0, zone_type=ZoneType.START, max_drones=4, id=0)
+    hub_b = Hub("b", 1, 1, zone_type=ZoneType.END, max_drones=2, id=1)
     cfg = _cfg_with_zone_type_attr([hub_a, hub_b], [Connection("a", "b", 2)])
 
     graph = Graph(None, None)
@@ -179,8 +184,8 @@ def test_get_r_expanded_list_preserves_vertex_count_and_caps() -> None:
 
 # round2 get_r_expanded_list hardening
 def test_round2_get_r_expanded_list_t1_has_no_reverse_edges() -> None:
-    hub_a = Hub("a", 0, 0, zone=ZoneType.NORMAL)
-    hub_b = Hub("b", 1, 1, zone=ZoneType.NORMAL)
+    hub_a = Hub("a", 0, 0, zone_type=ZoneType.NORMAL, id=0)
+    hub_b = Hub("b", 1, 1, zone_type=ZoneType.NORMAL, id=1)
     cfg = _cfg_with_zone_type_attr([hub_a, hub_b], [Connection("a", "b", 2)])
 
     graph = Graph(None, None)
@@ -192,8 +197,8 @@ def test_round2_get_r_expanded_list_t1_has_no_reverse_edges() -> None:
 
 
 def test_round2_get_r_expanded_list_skips_vertices_with_non_positive_cap() -> None:
-    hub_a = Hub("a", 0, 0, zone=ZoneType.NORMAL)
-    hub_r = Hub("r", 1, 1, zone=ZoneType.RESTRICTED, max_drones=1)
+    hub_a = Hub("a", 0, 0, zone_type=ZoneType.NORMAL, id=0)
+    hub_r = Hub("r", 1, 1, zone_type=ZoneType.RESTRICTED, max_drones=1, id=1)
     cfg = _cfg_with_zone_type_attr([hub_a, hub_r], [Connection("a", "r", 4)])
 
     graph = Graph(None, None)
@@ -208,8 +213,8 @@ def test_round2_get_r_expanded_list_skips_vertices_with_non_positive_cap() -> No
 
 
 def test_round2_get_r_expanded_list_adds_reverse_edge_into_restricted_transit() -> None:
-    hub_n = Hub("n", 0, 0, zone=ZoneType.NORMAL)
-    hub_r = Hub("r", 1, 1, zone=ZoneType.RESTRICTED)
+    hub_n = Hub("n", 0, 0, zone_type=ZoneType.NORMAL, id=0)
+    hub_r = Hub("r", 1, 1, zone_type=ZoneType.RESTRICTED, id=1)
     cfg = _cfg_with_zone_type_attr([hub_n, hub_r], [Connection("n", "r", 6)])
 
     graph = Graph(None, None)
@@ -222,3 +227,179 @@ def test_round2_get_r_expanded_list_adds_reverse_edge_into_restricted_transit()
     assert (graph.get_id_time(hub_n.id, 0), 6, 1) in [
         (e.to_hub, e.cap, e.weight) for e in transit_t1.edges
     ]
+
+
+def test_get_csr_stores_every_connection_in_both_directions() -> None:
+    hubs = [Hub("a", 0, 0, id=0), Hub("b", 1, 1, id=1), Hub("c", 2, 2, id=2)]
+    cfg = Config(1, hubs[0], hubs[-1], hubs, [
+        Connection("a", "b", 2),
+        Connection("c", "b", 1),
+    ])
+
+    graph = Graph(None, None)
+    graph.get_base_graph(cfg)
+
+    assert list(graph.indptr) == [0, 1, 3, 4]
+    assert list(graph.indices) == [1, 0, 2, 1]
+    assert graph.has_solution(0, 2) is True
+
+
+def test_get_base_graph_raises_when_end_is_unreachable() -> None:
+    hubs = [Hub("a", 0, 0, id=0), Hub("b", 1, 1, id=1), Hub("c", 2, 2, id=2)]
+    cfg = Config(1, hubs[0], hubs[-1], hubs, [Connection("a", "b", 1)])
+
+    with pytest.raises(ValueError, match="not connected"):
+        Graph(None, None).get_base_graph(cfg)
+
+
+def test_has_solution_switches_to_bottom_up_on_dense_maps(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # two complete components of 10 hubs, start and end in the first one
+    # (big enough to skip the one-sided search for tiny maps)
+    hubs = [Hub(f"h{i}", i, i, id=i) for i in range(20)]
+    connections = [
+        Connection(f"h{i}", f"h{j}", 1)
+        for base in (0, 10)
+        for i in range(base, base + 10)
+        for j in range(i + 1, base + 10)
+    ]
+    cfg = Config(1, hubs[0], hubs[9], hubs, connections)
+
+    graph = Graph(None, None)
+    graph.get_base_graph(cfg)
+
+    # record the direction of every level the search expands
+    directions: list[bool] = []
+    expand_level = Graph._expand_level
+
+    def spy(cls: type[Graph], *args: object) -> int:
+        directions.append(bool(args[-1]))
+        return expand_level(*args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Graph, "_expand_level", classmethod(spy))
+
+    # neighbors, answered without a search
+    assert graph.has_solution(1, 4) is True
+    assert graph.has_solution(17, 10) is True
+    assert directions == []
+
+    assert graph.has_solution(0, 19) is False
+    assert True in directions
+
+
+def test_has_solution_uses_one_sided_search_on_tiny_maps() -> None:
+    hubs = [Hub(f"h{i}", i, 0, id=i) for i in range(5)]
+    connections = [Connection("h0", "h1", 1), Connection("h1", "h2", 1),
+                   Connection("h3", "h4", 1)]
+    cfg = Config(1, hubs[0], hubs[2], hubs, connections)
+
+    graph = Graph(None, None)
+    graph.get_base_graph(cfg)
+
+    assert graph.has_solution(0, 2) is True
+    assert graph.has_solution(0, 4) is False
+    # the two-sided search buffers are never allocated
+    assert len(graph._queue[0]) == 0
+
+
+def test_get_base_graph_prunes_connections_to_blocked_hubs() -> None:
+    hubs = [
+        Hub("a", 0, 0, id=0),
+        Hub("x", 1, 1, ZoneType.BLOCKED, id=1),
+        Hub("b", 2, 2, id=2),
+    ]
+    cfg = Config(1, hubs[0], hubs[-1], hubs, [
+        Connection("a", "x", 1),
+        Connection("x", "b", 1),
+        Connection("a", "b", 1),
+    ])
+
+    graph = Graph(None, None)
+    base_graph = graph.get_base_graph(cfg)
+
+    assert [e.to_hub for e in base_graph[0].edges] == [2]
+    assert base_graph[1].edges == []
+    assert list(graph.indptr) == [0, 1, 1, 2]
+    assert graph.has_solution(0, 1) is False
+
+
+def test_get_base_graph_builds_a_parsed_config() -> None:
+    cfg = Config.from_string(
+        "nb_drones: 1\n"
+        "start_hub: start 0 0\n"
+        "hub: mid 1 1\n"
+        "end_hub: goal 2 2\n"
+        "connection: start-mid\n"
+        "connection: mid-goal\n"
+    )
+
+    base_graph = Graph(None, None).get_base_graph(cfg)
+    assert [e.to_hub for e in base_graph[1].edges] == [0, 2]
+
+
+def test_get_base_graph_revalidates_names_after_config_edits() -> None:
+    cfg = Config.from_string(
+        "nb_drones: 1\n"
+        "start_hub: a 0 0\n"
+        "end_hub: b 1 1\n"
+        "connection: a-b\n"
+    )
+    cfg.hubs.append(Hub("c", 2, 2, id=2))
+    cfg.connections.append(Connection("b", "c", 1))
+
+    base_graph = Graph(None, None).get_base_graph(cfg)
+    assert [e.to_hub for e in base_graph[1].edges] == [0, 2]
+
+    cfg.connections.append(Connection("c", "ghost", 1))
+    with pytest.raises(ValueError, match="Unknown name found in connection"):
+        Graph(None, None).get_base_graph(cfg)
+
+
+def test_get_base_graph_revalidates_same_size_config_edits() -> None:
+    text = (
+        "nb_drones: 1\n"
+        "start_hub: a 0 0\n"
+        "end_hub: b 1 1\n"
+        "connection: a-b\n"
+    )
+    cfg = Config.from_string(text)
+    cfg.connections[0] = Connection("a", "ghost", 1)
+    with pytest.raises(ValueError, match="Unknown name found in connection"):
+        Graph(None, None).get_base_graph(cfg)
+
+    cfg = Config.from_string(text)
+    cfg.hubs[1].name = "zz"
+    cfg.connections[0] = Connection("a", "zz", 1)
+    base_graph = Graph(None, None).get_base_graph(cfg)
+    assert [e.to_hub for e in base_graph[0].edges] == [1]
+
+
+def test_has_solution_meets_in_the_middle_of_a_long_chain() -> None:
+    hubs = [Hub(f"h{i}", i, 0, id=i) for i in range(300)]
+    connections = [
+        Connection(f"h{i}", f"h{i + 1}", 1) for i in range(299)
+    ]
+    cfg = Config(1, hubs[0], hubs[-1], hubs, connections)
+
+    graph = Graph(None, None)
+    graph.get_base_graph(cfg)
+
+    assert graph.has_solution(0, 299) is True
+    assert graph.has_solution(299, 150) is True
+
+
+def test_has_solution_caches_answers_until_the_csr_changes() -> None:
+    hubs = [Hub(f"h{i}", i, 0, id=i) for i in range(4)]
+    cfg = Config(1, hubs[0], hubs[2], hubs,
+                 [Connection("h0", "h1", 1), Connection("h1", "h2", 1)])
+    graph = Graph(None, None)
+    graph.get_base_graph(cfg)
+
+    assert graph.has_solution(2, 0) is True
+    assert graph.has_solution(0, 3) is False
+    assert graph._reach == {(0, 2): True, (0, 3): False}
+
+    cfg.connections.append(Connection("h2", "h3", 1))
+    graph.get_base_graph(cfg)
+    assert graph.has_solution(0, 3) is True
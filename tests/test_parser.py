@@ -6,6 +6,7 @@ from __future__ import annotations
 # random/malformed inputs, and mutation testing alters code to verify test strength.
 # Those are recommended hardening steps beyond typical school-project scope.
 
+import io
 import random
 import sys
 from pathlib import Path
@@ -108,7 +109,7 @@ def test_parse_hub_valid_minimal() -> None:
     assert hub.name == "roof1"
     assert hub.x == 0
     assert hub.y == 4
-    assert hub.zone == ZoneType.NORMAL
+    assert hub.zone_type == ZoneType.NORMAL
     assert hub.color is None
     assert hub.max_drones == 1
 
@@ -119,7 +120,7 @@ def test_parse_hub_valid_with_metadata() -> None:
     assert hub.name == "roof1"
     assert hub.x == 3
     assert hub.y == 4
-    assert hub.zone == ZoneType.PRIORITY
+    assert hub.zone_type == ZoneType.PRIORITY
     assert hub.color == "green"
     assert hub.max_drones == 2
 
@@ -135,7 +136,7 @@ def test_parse_hub_allows_negative_coordinate() -> None:
     assert hub.name == "roof1"
     assert hub.x == -1
     assert hub.y == 4
-    assert hub.zone == ZoneType.NORMAL
+    assert hub.zone_type == ZoneType.NORMAL
     assert hub.color is None
     assert hub.max_drones == 1
 
@@ -193,9 +194,7 @@ def test_round2_parse_metadata_preserves_unknown_color_string() -> None:
     assert result[Metadata.COLOR] == "madeupshade"
 
 
-def test_round2_from_file_rejects_connection_to_undefined_hub(
-    tmp_path: Path,
-) -> None:
+def test_round2_from_string_rejects_connection_to_undefined_hub() -> None:
     config_content = "\n".join(
         [
             "nb_drones: 1",
@@ -204,11 +203,8 @@ def test_round2_from_file_rejects_connection_to_undefined_hub(
             "connection: start-missing",
         ]
     )
-    config_path = tmp_path / "invalid_undefined_connection.txt"
-    config_path.write_text(config_content, encoding="utf-8")
-
     with pytest.raises(ValueError):
-        Config.from_file(str(config_path))
+        Config.from_string(config_content)
 
 
 # 3rd round inspection: deeper edge-case coverage
@@ -218,7 +214,7 @@ def test_round3_parse_hub_metadata_out_of_order_is_valid() -> None:
     assert hub.name == "roof1"
     assert hub.x == 1
     assert hub.y == 2
-    assert hub.zone == ZoneType.PRIORITY
+    assert hub.zone_type == ZoneType.PRIORITY
     assert hub.color == "blue"
     assert hub.max_drones == 4
 
@@ -238,9 +234,7 @@ def test_round3_parse_hub_rejects_unbracketed_metadata() -> None:
         Config._parse_hub("roof1 1 2 zone=normal")
 
 
-def test_round3_from_file_rejects_duplicate_name_start_and_hub(
-    tmp_path: Path,
-) -> None:
+def test_round3_from_string_rejects_duplicate_name_start_and_hub() -> None:
     config_content = "\n".join(
         [
             "nb_drones: 1",
@@ -249,16 +243,11 @@ def test_round3_from_file_rejects_duplicate_name_start_and_hub(
             "end_hub: goal 2 2",
         ]
     )
-    config_path = tmp_path / "invalid_duplicate_start_hub_name.txt"
-    config_path.write_text(config_content, encoding="utf-8")
-
     with pytest.raises(ValueError, match="Duplicate name"):
-        Config.from_file(str(config_path))
+        Config.from_string(config_content)
 
 
-def test_round3_from_file_rejects_duplicate_name_start_and_end(
-    tmp_path: Path,
-) -> None:
+def test_round3_from_string_rejects_duplicate_name_start_and_end() -> None:
     config_content = "\n".join(
         [
             "nb_drones: 1",
@@ -266,11 +255,8 @@ def test_round3_from_file_rejects_duplicate_name_start_and_end(
             "end_hub: same 2 2",
         ]
     )
-    config_path = tmp_path / "invalid_duplicate_start_end_name.txt"
-    config_path.write_text(config_content, encoding="utf-8")
-
     with pytest.raises(ValueError, match="Duplicate name"):
-        Config.from_file(str(config_path))
+        Config.from_string(config_content)
 
 
 # 4th round inspection: larger edge-case suite for parser hardening
@@ -294,6 +280,23 @@ def test_round4_parse_hub_rejects_non_integer_coordinate() -> None:
         Config._parse_hub("roof1 a 4")
 
 
+def test_safe_int_accepts_signs_and_rejects_non_ascii_digits() -> None:
+    assert Config._safe_int(" -3 ") == -3
+    assert Config._safe_int("+4") == 4
+    for bad in ("", "-", "1_000", "\u00b2", "1.5"):
+        with pytest.raises(ValueError, match="invalid integer"):
+            Config._safe_int(bad)
+    assert Config._safe_int("3", Metadata.MAX_LINK_CAPACITY) == 3
+
+
+def test_parse_metadata_rejects_signed_capacities() -> None:
+    for bad in ("-3", "+3"):
+        with pytest.raises(
+            ValueError, match="max_link_capacity must be an integer"
+        ):
+            Config._parse_metadata(f"[max_link_capacity={bad}]", "connection")
+
+
 def test_round4_parse_hub_rejects_non_integer_max_drones() -> None:
     with pytest.raises(ValueError, match="must be an integer"):
         Config._parse_hub("roof1 1 2 [max_drones=abc]")
@@ -309,7 +312,7 @@ def test_round4_parse_connection_rejects_zero_capacity() -> None:
         Config._parse_connection("roof1-goal [max_link_capacity=0]")
 
 
-def test_round4_from_file_accepts_comments_and_blank_lines(tmp_path: Path) -> None:
+def test_round4_from_string_accepts_comments_and_blank_lines() -> None:
     config_content = "\n".join(
         [
             "# comment line",
@@ -324,20 +327,48 @@ def test_round4_from_file_accepts_comments_and_blank_lines(tmp_path: Path) -> No
             "",
         ]
     )
+    cfg = Config.from_string(config_content)
+    assert cfg.nb_drones == 2
+    assert cfg.start_hub.name == "start"
+    assert cfg.start_hub.zone_type == ZoneType.START
+    assert cfg.end_hub.name == "goal"
+    assert cfg.end_hub.zone_type == ZoneType.END
+    assert len(cfg.hubs) == 3
+    assert len(cfg.connections) == 2
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+def test_round4_from_file_accepts_comments_and_blank_lines(
+    tmp_path: Path, newline: str,
+) -> None:
+    config_content = newline.join(
+        [
+            "# comment line",
+            "",
+            "nb_drones: 2",
+            "",
+            "start_hub: start 0 0",
+            "hub: mid 1 1",
+            "end_hub: goal 2 2",
+            "connection: start-mid",
+            "connection: mid-goal",
+            "",
+        ]
+    )
     config_path = tmp_path / "valid_with_comments.txt"
-    config_path.write_text(config_content, encoding="utf-8")
+    config_path.write_bytes(config_content.encode("utf-8"))
 
     cfg = Config.from_file(str(config_path))
     assert cfg.nb_drones == 2
     assert cfg.start_hub.name == "start"
-    assert cfg.start_hub.zone == ZoneType.START
+    assert cfg.start_hub.zone_type == ZoneType.START
     assert cfg.end_hub.name == "goal"
-    assert cfg.end_hub.zone == ZoneType.END
+    assert cfg.end_hub.zone_type == ZoneType.END
     assert len(cfg.hubs) == 3
     assert len(cfg.connections) == 2
 
 
-def test_round4_from_file_rejects_unknown_key(tmp_path: Path) -> None:
+def test_round4_from_string_rejects_unknown_key() -> None:
     config_content = "\n".join(
         [
             "nb_drones: 2",
@@ -346,14 +377,11 @@ def test_round4_from_file_rejects_unknown_key(tmp_path: Path) -> None:
             "portal: p1 3 3",
         ]
     )
-    config_path = tmp_path / "invalid_unknown_key.txt"
-    config_path.write_text(config_content, encoding="utf-8")
-
     with pytest.raises(ValueError, match="Key must be"):
-        Config.from_file(str(config_path))
+        Config.from_string(config_content)
 
 
-def test_round4_from_file_rejects_missing_colon(tmp_path: Path) -> None:
+def test_round4_from_string_rejects_missing_colon() -> None:
     config_content = "\n".join(
         [
             "nb_drones: 2",
@@ -361,14 +389,11 @@ def test_round4_from_file_rejects_missing_colon(tmp_path: Path) -> None:
             "end_hub: goal 1 1",
         ]
     )
-    config_path = tmp_path / "invalid_missing_colon.txt"
-    config_path.write_text(config_content, encoding="utf-8")
-
     with pytest.raises(ValueError, match="No ':' character in line"):
-        Config.from_file(str(config_path))
+        Config.from_string(config_content)
 
 
-def test_round4_from_file_rejects_duplicate_start_hub_line(tmp_path: Path) -> None:
+def test_round4_from_string_rejects_duplicate_start_hub_line() -> None:
     config_content = "\n".join(
         [
             "nb_drones: 2",
@@ -377,14 +402,11 @@ def test_round4_from_file_rejects_duplicate_start_hub_line(tmp_path: Path) -> No
             "end_hub: goal 2 2",
         ]
     )
-    config_path = tmp_path / "invalid_duplicate_start_hub_line.txt"
-    config_path.write_text(config_content, encoding="utf-8")
-
-    with pytest.raises(ValueError, match="start_hub must not have duplicate"):
-        Config.from_file(str(config_path))
+    with pytest.raises(ValueError, match="start_hub: No have duplicate"):
+        Config.from_string(config_content)
 
 
-def test_round4_from_file_rejects_missing_required_end_hub(tmp_path: Path) -> None:
+def test_round4_from_string_rejects_missing_required_end_hub() -> None:
     config_content = "\n".join(
         [
             "nb_drones: 2",
@@ -392,11 +414,8 @@ def test_round4_from_file_rejects_missing_required_end_hub(tmp_path: Path) -> No
             "hub: mid 1 1",
         ]
     )
-    config_path = tmp_path / "invalid_missing_end_hub.txt"
-    config_path.write_text(config_content, encoding="utf-8")
-
     with pytest.raises(ValueError, match="missing required config"):
-        Config.from_file(str(config_path))
+        Config.from_string(config_content)
 
 
 # 5th round inspection: mutation-style + fuzz/property + stress tests
@@ -435,7 +454,7 @@ def test_round5_property_parse_hub_random_coords_roundtrip() -> None:
         assert hub.name == f"h{i}"
         assert hub.x == x
         assert hub.y == y
-        assert hub.zone == ZoneType.NORMAL
+        assert hub.zone_type == ZoneType.NORMAL
         assert hub.max_drones == 1
 
 
@@ -449,36 +468,30 @@ def test_round5_property_parse_metadata_random_unknown_colors_preserved() -> Non
         assert result[Metadata.COLOR] == color
 
 
-def test_round5_stress_from_file_large_generated_map(tmp_path: Path) -> None:
+def test_round5_stress_from_string_large_generated_map() -> None:
     hub_count = 250
-    lines = [
-        "nb_drones: 25",
-        "start_hub: start 0 0 [color=green]",
-    ]
+    buf = io.StringIO()
+    buf.write("nb_drones: 25\nstart_hub: start 0 0 [color=green]\n")
     for idx in range(hub_count):
-        lines.append(f"hub: h{idx} {idx} {-idx} [color=blue]")
-    lines.append("end_hub: goal 999 -999 [color=red]")
-    lines.append("connection: start-h0")
+        buf.write(f"hub: h{idx} {idx} {-idx} [color=blue]\n")
+    buf.write("end_hub: goal 999 -999 [color=red]\nconnection: start-h0\n")
     for idx in range(hub_count - 1):
-        lines.append(f"connection: h{idx}-h{idx + 1}")
-    lines.append(f"connection: h{hub_count - 1}-goal [max_link_capacity=2]")
-
-    config_path = tmp_path / "stress_large_generated_map.txt"
-    config_path.write_text("\n".join(lines), encoding="utf-8")
+        buf.write(f"connection: h{idx}-h{idx + 1}\n")
+    buf.write(f"connection: h{hub_count - 1}-goal [max_link_capacity=2]\n")
 
-    cfg = Config.from_file(str(config_path))
+    cfg = Config.from_string(buf.getvalue())
     assert cfg.nb_drones == 25
     assert cfg.start_hub.name == "start"
-    assert cfg.start_hub.zone == ZoneType.START
+    assert cfg.start_hub.zone_type == ZoneType.START
     assert cfg.end_hub.name == "goal"
-    assert cfg.end_hub.zone == ZoneType.END
+    assert cfg.end_hub.zone_type == ZoneType.END
     assert len(cfg.hubs) == hub_count + 2
     assert len(cfg.connections) == hub_count + 1
 
 
 def test_parse_start_hub_with_metadata_keeps_start_zone() -> None:
     hub = Config._parse_hub("start 0 0 [color=green max_drones=9]", "start_hub")
-    assert hub.zone == ZoneType.START
+    assert hub.zone_type == ZoneType.START
     assert hub.color == "green"
     assert hub.max_drones == 9
 
@@ -486,3 +499,32 @@ def test_parse_start_hub_with_metadata_keeps_start_zone() -> None:
 def test_parse_end_hub_rejects_duplicate_zone_input() -> None:
     with pytest.raises(ValueError, match="Duplicate zones inputted"):
         Config._parse_hub("goal 1 1 [zone=priority]", "end_hub")
+
+
+def test_from_file_empty_file_reports_missing_configs(tmp_path: Path) -> None:
+    config_path = tmp_path / "empty.txt"
+    config_path.write_bytes(b"")
+
+    with pytest.raises(ValueError, match="missing required config"):
+        Config.from_file(str(config_path))
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+def test_from_file_and_from_string_agree_on_line_endings(
+    tmp_path: Path, newline: str,
+) -> None:
+    text = newline.join([
+        "nb_drones: 3",
+        "start_hub: start 0 0",
+        "end_hub: goal 4 5 [color=red]",
+        "connection: start-goal [max_link_capacity=2]",
+        "",
+    ])
+    config_path = tmp_path / "map.txt"
+    config_path.write_bytes(text.encode("utf-8"))
+
+    for cfg in (Config.from_file(str(config_path)), Config.from_string(text)):
+        assert cfg.nb_drones == 3
+        assert (cfg.end_hub.x, cfg.end_hub.y) == (4, 5)
+        assert cfg.end_hub.color == "red"
+        assert cfg.connections[0].max_link_capacity == 2